@@ -0,0 +1,85 @@
+"""Set-based write paths for high-volume tables.
+
+These bypass the ORM unit of work: rows are plain dicts sent as one executemany statement, so no model
+instances are built or tracked. The caller owns the session and commits.
+"""
+
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session
+
+from app.models import HrdAttendance, HrdAuditLog, HrdAuditLogPayload, normalize_ip_address
+
+_ATTENDANCE_UPSERT_FIELDS = ("check_in_time", "check_out_time", "status", "total_hours")
+
+# Model defaults the ORM would normally apply; Core inserts skip them, and status is NOT NULL
+_ATTENDANCE_DEFAULTS = {
+    name: HrdAttendance.model_fields[name].default for name in ("status", "overtime_hours", "notes")
+}
+
+
+def _uniform_rows(rows: List[Dict[str, Any]], defaults: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Give every row the same keys, filling gaps from `defaults` and then with None.
+
+    An executemany statement is compiled from the first row's keys: values under keys only later rows carry
+    would be dropped, and keys missing from later rows raise a missing bind parameter error.
+    """
+    keys = set(defaults).union(*rows)
+    template = {**dict.fromkeys(keys), **defaults}
+    return [{**template, **row} for row in rows]
+
+
+def bulk_upsert_attendance(session: Session, rows: List[Dict[str, Any]]) -> None:
+    """Insert attendance rows, updating times, status and hours where (user_id, date) already exists.
+
+    Each row needs user_id and date. On conflict, check_in_time, check_out_time, status and total_hours
+    replace the stored values, so pass their final values; an omitted time or total_hours becomes NULL.
+    status, overtime_hours and notes fall back to the model defaults when omitted. Rows may carry different
+    keys. If the batch holds several rows for one (user_id, date), only the last is written, since one
+    INSERT ... ON CONFLICT cannot update the same row twice. Relies on the unique index on
+    hrd_attendance (user_id, date).
+    """
+    if not rows:
+        return
+    latest = {(row["user_id"], row["date"]): row for row in rows}
+    rows = _uniform_rows(list(latest.values()), {**dict.fromkeys(_ATTENDANCE_UPSERT_FIELDS), **_ATTENDANCE_DEFAULTS})
+    stmt = pg_insert(HrdAttendance)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "date"],
+        set_={field: stmt.excluded[field] for field in _ATTENDANCE_UPSERT_FIELDS},
+    )
+    session.execute(stmt, rows)
+
+
+def bulk_insert_audit_logs(session: Session, entries: List[Dict[str, Any]]) -> List[int]:
+    """Insert audit log entries with their payloads and return the new ids in input order.
+
+    Each entry holds the HrdAuditLog header fields and, optionally, old_values, new_values and user_agent.
+    Entries may carry different keys; an omitted record_id is stored as NULL, and an ip_address that is
+    missing or not an IP address is stored as NULL.
+    """
+    if not entries:
+        return []
+    headers = _uniform_rows(
+        [
+            {key: value for key, value in entry.items() if key not in ("old_values", "new_values", "user_agent")}
+            for entry in entries
+        ],
+        {"record_id": None, "ip_address": None},
+    )
+    for header in headers:
+        header["ip_address"] = normalize_ip_address(header["ip_address"])
+    ids = list(session.scalars(insert(HrdAuditLog).returning(HrdAuditLog.id, sort_by_parameter_order=True), headers))
+    payloads = [
+        {
+            "id": audit_id,
+            "old_values": entry.get("old_values", {}),
+            "new_values": entry.get("new_values", {}),
+            "user_agent": entry.get("user_agent", ""),
+        }
+        for audit_id, entry in zip(ids, entries, strict=True)
+    ]
+    session.execute(insert(HrdAuditLogPayload), payloads)
+    return ids
@@ -0,0 +1,80 @@
+"""Process-local cache for the near-static lookup tables: departments, positions, holidays and settings.
+
+Results are keyed by a version number kept in ``hrd_settings``. Reading that single row is far cheaper than
+re-selecting the lookup tables on every request, and because the version lives in the database, a change made
+by any worker process invalidates the caches of all of them:
+
+    with get_session() as session:
+        departments = all_departments_cached(get_lookup_version(session))
+
+Code that creates, updates or deletes rows in one of these tables must call ``bump_lookup_version`` in the
+same transaction.
+
+Cached model instances are detached from any session; treat them as read-only.
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+from sqlalchemy import Integer, String, cast, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, col, select
+
+from app.database import get_session
+from app.models import HrdDepartment, HrdHoliday, HrdPosition, HrdSetting
+
+LOOKUP_VERSION_KEY = "lookup_cache_version"
+
+
+def get_lookup_version(session: Session) -> int:
+    value = session.exec(select(HrdSetting.value).where(HrdSetting.key == LOOKUP_VERSION_KEY)).first()
+    if value is None:
+        return 0
+    return int(value)
+
+
+def bump_lookup_version(session: Session, updated_by: int) -> None:
+    """Invalidate every process's lookup caches. The caller commits."""
+    stmt = pg_insert(HrdSetting).values(
+        key=LOOKUP_VERSION_KEY,
+        value="1",
+        description="Bumped whenever departments, positions, holidays or settings change",
+        data_type="integer",
+        is_system=True,
+        updated_by=updated_by,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["key"],
+        set_={
+            "value": cast(cast(col(HrdSetting.value), Integer) + 1, String),
+            "updated_by": stmt.excluded.updated_by,
+            "updated_at": func.timezone("UTC", func.now()),
+        },
+    )
+    session.execute(stmt)
+
+
+@lru_cache(maxsize=1)
+def all_departments_cached(version: int) -> tuple[HrdDepartment, ...]:
+    with get_session() as session:
+        return tuple(session.exec(select(HrdDepartment)).all())
+
+
+@lru_cache(maxsize=1)
+def all_positions_cached(version: int) -> tuple[HrdPosition, ...]:
+    with get_session() as session:
+        return tuple(session.exec(select(HrdPosition)).all())
+
+
+@lru_cache(maxsize=1)
+def all_holidays_cached(version: int) -> tuple[HrdHoliday, ...]:
+    with get_session() as session:
+        return tuple(session.exec(select(HrdHoliday).order_by(HrdHoliday.date)).all())
+
+
+@lru_cache(maxsize=1)
+def all_settings_cached(version: int) -> Mapping[str, str]:
+    with get_session() as session:
+        rows = session.exec(select(HrdSetting.key, HrdSetting.value)).all()
+    return MappingProxyType({key: value for key, value in rows})
@@ -1,9 +1,64 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+import ipaddress
+import logging
+import re
+from dataclasses import dataclass
+from sqlmodel import SQLModel, Field, Relationship, JSON, Column, Index, PrimaryKeyConstraint, col, text
+from pydantic import computed_field, field_validator, model_validator
+from sqlalchemy import Computed, Integer, String, func
+from sqlalchemy.dialects.postgresql import INET, JSONB
+from sqlalchemy.orm import defer, joinedload, raiseload
 from datetime import datetime, date, time
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Self, TypeVar
 from decimal import Decimal
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
+# Compiled once at import; shared by every model that validates an email address. Used with fullmatch, since
+# a "$" anchor would also match before a trailing newline.
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+
+
+# Shared default for zero-valued money and hour fields
+_ZERO = Decimal("0")
+
+# Binary JSONB on PostgreSQL, plain JSON on any other dialect
+_JSON = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _utc_now_column(on_update: bool = False) -> Dict[str, Any]:
+    """Column kwargs that let the database stamp the current UTC time instead of Python."""
+    kwargs: Dict[str, Any] = {"server_default": func.timezone("UTC", func.now())}
+    if on_update:
+        kwargs["onupdate"] = func.timezone("UTC", func.now())
+    return kwargs
+
+
+def _check_email(value: str) -> str:
+    if _EMAIL_RE.fullmatch(value) is None:
+        raise ValueError("Invalid email address")
+    return value
+
+
+def _check_coordinates(latitude: Optional[float], longitude: Optional[float]) -> None:
+    if (latitude is None) != (longitude is None):
+        raise ValueError("latitude and longitude must be given together")
+
+
+def normalize_ip_address(value: Optional[str]) -> Optional[str]:
+    """Canonical form of a client IP address, or None when there is none that INET would accept.
+
+    Request metadata is not always an address (a missing request.client, "", "unknown", Starlette's
+    "testclient"); such values are logged and dropped so they cannot abort the audited transaction.
+    """
+    if value is None:
+        return None
+    try:
+        return str(ipaddress.ip_address(value.strip()))
+    except ValueError:
+        logger.warning(f"Not an IP address, storing NULL: {value!r}")
+        return None
+
 
 # Enums for better type safety
 class UserRole(str, Enum):
@@ -50,6 +105,13 @@ class TrainingStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+class TrainingCompletionStatus(str, Enum):
+    ENROLLED = "enrolled"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    WITHDRAWN = "withdrawn"
+
+
 class DocumentType(str, Enum):
     CONTRACT = "contract"
     ID_CARD = "id_card"
@@ -70,17 +132,26 @@ class HrdUser(SQLModel, table=True):
     __tablename__ = "hrd_users"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    email: str = Field(unique=True, max_length=255, regex=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+    email: str = Field(unique=True, max_length=255)
     password_hash: str = Field(max_length=255)
     role: UserRole = Field(default=UserRole.EMPLOYEE)
     is_active: bool = Field(default=True)
     last_login: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
+    updated_at: Optional[datetime] = Field(
+        default=None, nullable=False, sa_column_kwargs=_utc_now_column(on_update=True)
+    )
 
     # Relationships
-    employee: Optional["HrdEmployee"] = Relationship(back_populates="user")
-    attendance_records: List["HrdAttendance"] = Relationship(back_populates="user")
+    employee: Optional["HrdEmployee"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "joined"})
+    attendance_records: List["HrdAttendance"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise"}
+    )
+
+    @field_validator("email")
+    @classmethod
+    def _validate_email(cls, value: str) -> str:
+        return _check_email(value)
 
 
 # 2. Employee Master Data
@@ -102,23 +173,48 @@ class HrdEmployee(SQLModel, table=True):
     department_id: Optional[int] = Field(default=None, foreign_key="hrd_departments.id")
     position_id: Optional[int] = Field(default=None, foreign_key="hrd_positions.id")
     manager_id: Optional[int] = Field(default=None, foreign_key="hrd_employees.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
+    updated_at: Optional[datetime] = Field(
+        default=None, nullable=False, sa_column_kwargs=_utc_now_column(on_update=True)
+    )
 
     # Relationships
-    user: HrdUser = Relationship(back_populates="employee")
-    department: Optional["HrdDepartment"] = Relationship(back_populates="employees")
-    position: Optional["HrdPosition"] = Relationship(back_populates="employees")
+    # Single-valued relationships are joined-loaded with the employee. Collections raise on
+    # lazy access, so callers must opt in with selectinload() instead of issuing N+1 queries.
+    user: HrdUser = Relationship(back_populates="employee", sa_relationship_kwargs={"lazy": "joined"})
+    department: Optional["HrdDepartment"] = Relationship(
+        back_populates="employees",
+        sa_relationship_kwargs={"lazy": "joined", "foreign_keys": "[HrdEmployee.department_id]"},
+    )
+    position: Optional["HrdPosition"] = Relationship(
+        back_populates="employees", sa_relationship_kwargs={"lazy": "joined"}
+    )
+    # The direct manager comes back in the same SELECT; join_depth stops the self-join after one level. The
+    # manager's own joined user/department/position come along too, so listings use EMPLOYEE_LIST_OPTIONS.
     manager: Optional["HrdEmployee"] = Relationship(
-        back_populates="subordinates", sa_relationship_kwargs={"remote_side": "HrdEmployee.id"}
+        back_populates="subordinates",
+        sa_relationship_kwargs={"remote_side": "HrdEmployee.id", "lazy": "joined", "join_depth": 1},
+    )
+    # Direct reports are batch-loaded one level deep with a single SELECT ... IN; deeper levels load on access.
+    subordinates: List["HrdEmployee"] = Relationship(
+        back_populates="manager", sa_relationship_kwargs={"lazy": "selectin", "join_depth": 1}
+    )
+    contracts: List["HrdContract"] = Relationship(back_populates="employee", sa_relationship_kwargs={"lazy": "raise"})
+    leave_requests: List["HrdLeaveRequest"] = Relationship(
+        back_populates="employee",
+        sa_relationship_kwargs={"lazy": "raise", "foreign_keys": "[HrdLeaveRequest.employee_id]"},
+    )
+    training_enrollments: List["HrdTrainingEnrollment"] = Relationship(
+        back_populates="employee", sa_relationship_kwargs={"lazy": "raise"}
+    )
+    performance_reviews: List["HrdPerformanceReview"] = Relationship(
+        back_populates="employee",
+        sa_relationship_kwargs={"lazy": "raise", "foreign_keys": "[HrdPerformanceReview.employee_id]"},
+    )
+    documents: List["HrdDocument"] = Relationship(back_populates="employee", sa_relationship_kwargs={"lazy": "raise"})
+    payroll_records: List["HrdPayroll"] = Relationship(
+        back_populates="employee", sa_relationship_kwargs={"lazy": "raise"}
     )
-    subordinates: List["HrdEmployee"] = Relationship(back_populates="manager")
-    contracts: List["HrdContract"] = Relationship(back_populates="employee")
-    leave_requests: List["HrdLeaveRequest"] = Relationship(back_populates="employee")
-    training_enrollments: List["HrdTrainingEnrollment"] = Relationship(back_populates="employee")
-    performance_reviews: List["HrdPerformanceReview"] = Relationship(back_populates="employee")
-    documents: List["HrdDocument"] = Relationship(back_populates="employee")
-    payroll_records: List["HrdPayroll"] = Relationship(back_populates="employee")
 
 
 # 3. Departments
@@ -130,13 +226,16 @@ class HrdDepartment(SQLModel, table=True):
     code: str = Field(unique=True, max_length=20)
     description: str = Field(default="", max_length=500)
     manager_id: Optional[int] = Field(default=None, foreign_key="hrd_employees.id")
-    budget: Optional[Decimal] = Field(default=None, decimal_places=2)
+    budget: Optional[Decimal] = Field(default=None, max_digits=12, decimal_places=2)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
 
     # Relationships
-    employees: List[HrdEmployee] = Relationship(back_populates="department")
-    positions: List["HrdPosition"] = Relationship(back_populates="department")
+    employees: List[HrdEmployee] = Relationship(
+        back_populates="department",
+        sa_relationship_kwargs={"lazy": "raise", "foreign_keys": "[HrdEmployee.department_id]"},
+    )
+    positions: List["HrdPosition"] = Relationship(back_populates="department", sa_relationship_kwargs={"lazy": "raise"})
 
 
 # 4. Positions
@@ -149,15 +248,15 @@ class HrdPosition(SQLModel, table=True):
     description: str = Field(default="", max_length=1000)
     department_id: int = Field(foreign_key="hrd_departments.id")
     level: str = Field(max_length=50)  # Entry, Mid, Senior, Executive
-    min_salary: Optional[Decimal] = Field(default=None, decimal_places=2)
-    max_salary: Optional[Decimal] = Field(default=None, decimal_places=2)
+    min_salary: Optional[Decimal] = Field(default=None, max_digits=12, decimal_places=2)
+    max_salary: Optional[Decimal] = Field(default=None, max_digits=12, decimal_places=2)
     requirements: str = Field(default="", max_length=2000)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
 
     # Relationships
     department: HrdDepartment = Relationship(back_populates="positions")
-    employees: List[HrdEmployee] = Relationship(back_populates="position")
+    employees: List[HrdEmployee] = Relationship(back_populates="position", sa_relationship_kwargs={"lazy": "raise"})
 
 
 # 5. Employment Contracts
@@ -169,13 +268,13 @@ class HrdContract(SQLModel, table=True):
     contract_type: str = Field(max_length=50)  # Permanent, Contract, Temporary
     start_date: date
     end_date: Optional[date] = Field(default=None)
-    base_salary: Decimal = Field(decimal_places=2)
-    allowances: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    benefits: List[str] = Field(default=[], sa_column=Column(JSON))
+    base_salary: Decimal = Field(max_digits=12, decimal_places=2)
+    allowances: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(_JSON))
+    benefits: List[str] = Field(default_factory=list, sa_column=Column(_JSON))
     working_hours: int = Field(default=40)  # hours per week
     is_active: bool = Field(default=True)
     signed_date: Optional[date] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
 
     # Relationships
     employee: HrdEmployee = Relationship(back_populates="contracts")
@@ -184,21 +283,33 @@ class HrdContract(SQLModel, table=True):
 # 6. Attendance Management
 class HrdAttendance(SQLModel, table=True):
     __tablename__ = "hrd_attendance"  # type: ignore[assignment]
+    __table_args__ = (
+        # One record per user per day; also the conflict target for check-in upserts
+        Index("ix_hrd_attendance_user_id_date", "user_id", "date", unique=True),
+        Index("ix_hrd_attendance_date_brin", "date", postgresql_using="brin"),
+        # PostgreSQL requires the partition key in the primary key
+        PrimaryKeyConstraint("id", "date"),
+        # Monthly range partitions are created by app.database.ensure_attendance_partitions
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, nullable=False, sa_column_kwargs={"autoincrement": True})
     user_id: int = Field(foreign_key="hrd_users.id")
     date: date
     check_in_time: Optional[time] = Field(default=None)
     check_out_time: Optional[time] = Field(default=None)
     break_start_time: Optional[time] = Field(default=None)
     break_end_time: Optional[time] = Field(default=None)
-    total_hours: Optional[Decimal] = Field(default=None, decimal_places=2)
-    overtime_hours: Optional[Decimal] = Field(default=Decimal("0"), decimal_places=2)
+    total_hours: Optional[Decimal] = Field(default=None, max_digits=5, decimal_places=2)
+    overtime_hours: Optional[Decimal] = Field(default=_ZERO, max_digits=5, decimal_places=2)
     status: AttendanceStatus = Field(default=AttendanceStatus.ABSENT)
-    check_in_location: Optional[str] = Field(default=None, max_length=255)  # GPS coordinates
-    check_out_location: Optional[str] = Field(default=None, max_length=255)
+    # GPS coordinates in decimal degrees
+    check_in_lat: Optional[float] = Field(default=None)
+    check_in_lon: Optional[float] = Field(default=None)
+    check_out_lat: Optional[float] = Field(default=None)
+    check_out_lon: Optional[float] = Field(default=None)
     notes: str = Field(default="", max_length=500)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
 
     # Relationships
     user: HrdUser = Relationship(back_populates="attendance_records")
@@ -207,23 +318,32 @@ class HrdAttendance(SQLModel, table=True):
 # 7. Leave Management
 class HrdLeaveRequest(SQLModel, table=True):
     __tablename__ = "hrd_leave_requests"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_hrd_leave_requests_employee_id_status_start_date", "employee_id", "status", "start_date"),
+        Index("ix_hrd_leave_requests_pending", "status", postgresql_where=text("status = 'PENDING'")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     employee_id: int = Field(foreign_key="hrd_employees.id")
     leave_type: LeaveType
     start_date: date
     end_date: date
-    days_requested: int
+    # Maintained by PostgreSQL from the date range; never assigned by the application
+    days_requested: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, Computed("end_date - start_date + 1", persisted=True))
+    )
     reason: str = Field(max_length=1000)
     status: LeaveStatus = Field(default=LeaveStatus.PENDING)
     approved_by: Optional[int] = Field(default=None, foreign_key="hrd_employees.id")
     approved_at: Optional[datetime] = Field(default=None)
     rejection_reason: str = Field(default="", max_length=500)
-    supporting_documents: List[str] = Field(default=[], sa_column=Column(JSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    supporting_documents: List[str] = Field(default_factory=list, sa_column=Column(_JSON))
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
 
     # Relationships
-    employee: HrdEmployee = Relationship(back_populates="leave_requests")
+    employee: HrdEmployee = Relationship(
+        back_populates="leave_requests", sa_relationship_kwargs={"foreign_keys": "[HrdLeaveRequest.employee_id]"}
+    )
 
 
 # 8. Training Programs
@@ -236,17 +356,19 @@ class HrdTrainingProgram(SQLModel, table=True):
     trainer: str = Field(max_length=200)
     duration_hours: int
     max_participants: Optional[int] = Field(default=None)
-    cost_per_participant: Optional[Decimal] = Field(default=None, decimal_places=2)
+    cost_per_participant: Optional[Decimal] = Field(default=None, max_digits=12, decimal_places=2)
     start_date: datetime
     end_date: datetime
     location: str = Field(max_length=255)
     status: TrainingStatus = Field(default=TrainingStatus.SCHEDULED)
-    materials: List[str] = Field(default=[], sa_column=Column(JSON))
+    materials: List[str] = Field(default_factory=list, sa_column=Column(_JSON))
     prerequisites: str = Field(default="", max_length=1000)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
 
     # Relationships
-    enrollments: List["HrdTrainingEnrollment"] = Relationship(back_populates="training_program")
+    enrollments: List["HrdTrainingEnrollment"] = Relationship(
+        back_populates="training_program", sa_relationship_kwargs={"lazy": "raise"}
+    )
 
 
 # 9. Training Enrollments
@@ -256,17 +378,21 @@ class HrdTrainingEnrollment(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     employee_id: int = Field(foreign_key="hrd_employees.id")
     training_program_id: int = Field(foreign_key="hrd_training_programs.id")
-    enrollment_date: datetime = Field(default_factory=datetime.utcnow)
+    enrollment_date: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
     completion_date: Optional[datetime] = Field(default=None)
-    completion_status: str = Field(default="enrolled")  # enrolled, completed, failed, withdrawn
-    score: Optional[Decimal] = Field(default=None, decimal_places=2)
-    certificate_issued: bool = Field(default=False)
+    completion_status: TrainingCompletionStatus = Field(default=TrainingCompletionStatus.ENROLLED)
+    score: Optional[Decimal] = Field(default=None, max_digits=5, decimal_places=2)
     feedback: str = Field(default="", max_length=1000)
 
     # Relationships
     employee: HrdEmployee = Relationship(back_populates="training_enrollments")
     training_program: HrdTrainingProgram = Relationship(back_populates="enrollments")
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def certificate_issued(self) -> bool:
+        return self.completion_status == TrainingCompletionStatus.COMPLETED
+
 
 # 10. Performance Reviews
 class HrdPerformanceReview(SQLModel, table=True):
@@ -277,19 +403,22 @@ class HrdPerformanceReview(SQLModel, table=True):
     reviewer_id: int = Field(foreign_key="hrd_employees.id")
     review_period_start: date
     review_period_end: date
-    overall_rating: Decimal = Field(decimal_places=2)  # 1-5 scale
-    goals_achievement: Decimal = Field(decimal_places=2)
-    competency_scores: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    overall_rating: Decimal = Field(max_digits=3, decimal_places=2)  # 1-5 scale
+    goals_achievement: Decimal = Field(max_digits=5, decimal_places=2)
+    competency_scores: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(_JSON))
     strengths: str = Field(max_length=2000)
     areas_for_improvement: str = Field(max_length=2000)
     development_plan: str = Field(max_length=2000)
     employee_comments: str = Field(default="", max_length=2000)
     reviewer_comments: str = Field(max_length=2000)
     is_final: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
 
     # Relationships
-    employee: HrdEmployee = Relationship(back_populates="performance_reviews")
+    employee: HrdEmployee = Relationship(
+        back_populates="performance_reviews",
+        sa_relationship_kwargs={"foreign_keys": "[HrdPerformanceReview.employee_id]"},
+    )
 
 
 # 11. Documents Management
@@ -308,7 +437,7 @@ class HrdDocument(SQLModel, table=True):
     uploaded_by: int = Field(foreign_key="hrd_users.id")
     is_confidential: bool = Field(default=False)
     expiry_date: Optional[date] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
 
     # Relationships
     employee: HrdEmployee = Relationship(back_populates="documents")
@@ -317,24 +446,25 @@ class HrdDocument(SQLModel, table=True):
 # 12. Payroll Management
 class HrdPayroll(SQLModel, table=True):
     __tablename__ = "hrd_payroll"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_hrd_payroll_employee_id_pay_period_start", "employee_id", "pay_period_start"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     employee_id: int = Field(foreign_key="hrd_employees.id")
     pay_period_start: date
     pay_period_end: date
-    base_salary: Decimal = Field(decimal_places=2)
-    overtime_pay: Decimal = Field(default=Decimal("0"), decimal_places=2)
-    allowances: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    deductions: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    gross_pay: Decimal = Field(decimal_places=2)
-    tax_deduction: Decimal = Field(decimal_places=2)
-    net_pay: Decimal = Field(decimal_places=2)
+    base_salary: Decimal = Field(max_digits=12, decimal_places=2)
+    overtime_pay: Decimal = Field(default=_ZERO, max_digits=12, decimal_places=2)
+    allowances: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(_JSON))
+    deductions: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(_JSON))
+    gross_pay: Decimal = Field(max_digits=12, decimal_places=2)
+    tax_deduction: Decimal = Field(max_digits=12, decimal_places=2)
+    net_pay: Decimal = Field(max_digits=12, decimal_places=2)
     status: PayrollStatus = Field(default=PayrollStatus.DRAFT)
     processed_by: Optional[int] = Field(default=None, foreign_key="hrd_users.id")
     processed_at: Optional[datetime] = Field(default=None)
     payment_date: Optional[date] = Field(default=None)
     bank_reference: str = Field(default="", max_length=100)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
 
     # Relationships
     employee: HrdEmployee = Relationship(back_populates="payroll_records")
@@ -343,6 +473,7 @@ class HrdPayroll(SQLModel, table=True):
 # 13. Company Holidays
 class HrdHoliday(SQLModel, table=True):
     __tablename__ = "hrd_holidays"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_hrd_holidays_date", "date", unique=True),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=200)
@@ -351,7 +482,7 @@ class HrdHoliday(SQLModel, table=True):
     is_recurring: bool = Field(default=False)
     is_working_day: bool = Field(default=False)  # If true, employees still work but get holiday pay
     created_by: int = Field(foreign_key="hrd_users.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
 
 
 # 14. System Settings
@@ -365,27 +496,97 @@ class HrdSetting(SQLModel, table=True):
     data_type: str = Field(default="string")  # string, integer, boolean, json
     is_system: bool = Field(default=False)  # System settings cannot be deleted
     updated_by: int = Field(foreign_key="hrd_users.id")
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = Field(
+        default=None, nullable=False, sa_column_kwargs=_utc_now_column(on_update=True)
+    )
 
 
 # 15. Audit Log
 class HrdAuditLog(SQLModel, table=True):
     __tablename__ = "hrd_audit_logs"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_hrd_audit_logs_table_name_record_id_timestamp", "table_name", "record_id", "timestamp"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="hrd_users.id")
     action: str = Field(max_length=100)  # CREATE, UPDATE, DELETE, LOGIN, LOGOUT
     table_name: str = Field(max_length=100)
     record_id: Optional[int] = Field(default=None)
-    old_values: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    new_values: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    ip_address: str = Field(max_length=45)
+    # NULL when the client address is unknown. HrdAuditLog.model_validate and bulk_insert_audit_logs normalize
+    # it; direct construction skips validation, so pass the value through normalize_ip_address there.
+    ip_address: Optional[str] = Field(
+        default=None, sa_column=Column(String(45).with_variant(INET(), "postgresql"), nullable=True)
+    )
+    timestamp: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs=_utc_now_column())
+
+    # Relationships
+    # The bulky change payload lives in its own table so audit listings only scan the narrow header rows.
+    # Detail views load it explicitly with selectinload(HrdAuditLog.payload).
+    payload: Optional["HrdAuditLogPayload"] = Relationship(
+        back_populates="audit_log", sa_relationship_kwargs={"lazy": "raise", "uselist": False}
+    )
+
+    @field_validator("ip_address", mode="before")
+    @classmethod
+    def _validate_ip_address(cls, value: Optional[str]) -> Optional[str]:
+        return normalize_ip_address(value)
+
+
+# 16. Audit Log Payload
+class HrdAuditLogPayload(SQLModel, table=True):
+    __tablename__ = "hrd_audit_log_payloads"  # type: ignore[assignment]
+
+    id: Optional[int] = Field(default=None, primary_key=True, foreign_key="hrd_audit_logs.id")
+    old_values: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(_JSON))
+    new_values: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(_JSON))
     user_agent: str = Field(default="", max_length=500)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+    # Relationships
+    audit_log: HrdAuditLog = Relationship(back_populates="payload")
+
+
+# Loader options for listing queries. They skip the long free-text columns that only detail views render;
+# reading one of them on a loaded row costs one extra SELECT.
+#   session.exec(select(HrdPerformanceReview).options(*PERFORMANCE_REVIEW_LIST_OPTIONS))
+POSITION_LIST_OPTIONS = (defer(col(HrdPosition.description)), defer(col(HrdPosition.requirements)))
+TRAINING_PROGRAM_LIST_OPTIONS = (
+    defer(col(HrdTrainingProgram.description)),
+    defer(col(HrdTrainingProgram.prerequisites)),
+)
+PERFORMANCE_REVIEW_LIST_OPTIONS = (
+    defer(col(HrdPerformanceReview.strengths)),
+    defer(col(HrdPerformanceReview.areas_for_improvement)),
+    defer(col(HrdPerformanceReview.development_plan)),
+    defer(col(HrdPerformanceReview.employee_comments)),
+    defer(col(HrdPerformanceReview.reviewer_comments)),
+)
+
+# Employee listings get each employee plus their direct manager in one SELECT with a single self-join.
+# The default mapping would also join-load the user, department and position of both the employee and the
+# manager (password hashes, position descriptions). Those relationships and direct reports raise on access
+# rather than lazy-loading per row; resolve department/position names by id through app.lookup_cache.
+EMPLOYEE_LIST_OPTIONS = (
+    joinedload(col(HrdEmployee.manager)).raiseload("*"),
+    raiseload(col(HrdEmployee.user)),
+    raiseload(col(HrdEmployee.department)),
+    raiseload(col(HrdEmployee.position)),
+    raiseload(col(HrdEmployee.subordinates)),
+)
 
 
 # Non-persistent schemas for forms and API requests/responses
 
+SchemaT = TypeVar("SchemaT", bound=SQLModel)
+
+
+def construct_from_row(schema: type[SchemaT], row: Any) -> SchemaT:
+    """Build a response schema from a trusted ORM object or result row without re-running validation.
+
+    Use only for data read back from the database; request bodies must still go through model_validate.
+    """
+    return schema.model_construct(**{name: getattr(row, name) for name in schema.model_fields})
+
 
 # Authentication schemas
 class UserLogin(SQLModel, table=False):
@@ -393,11 +594,29 @@ class UserLogin(SQLModel, table=False):
     password: str = Field(max_length=100)
 
 
+class UserCredentials(SQLModel, table=False):
+    """Only what a login check needs; avoids loading the user row together with its joined employee graph."""
+
+    id: int
+    password_hash: str
+    role: UserRole
+    is_active: bool
+
+    @classmethod
+    def columns(cls) -> tuple[Any, ...]:
+        return tuple(getattr(HrdUser, name) for name in cls.model_fields)
+
+
 class UserCreate(SQLModel, table=False):
-    email: str = Field(max_length=255, regex=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+    email: str = Field(max_length=255)
     password: str = Field(min_length=6, max_length=100)
     role: UserRole = Field(default=UserRole.EMPLOYEE)
 
+    @field_validator("email")
+    @classmethod
+    def _validate_email(cls, value: str) -> str:
+        return _check_email(value)
+
 
 # Employee schemas
 class EmployeeCreate(SQLModel, table=False):
@@ -429,16 +648,43 @@ class EmployeeUpdate(SQLModel, table=False):
     employment_status: Optional[EmploymentStatus] = Field(default=None)
 
 
+class EmployeeListItem(SQLModel, table=False):
+    """Narrow projection for employee listings; skips address, contacts and other detail-only columns."""
+
+    id: int
+    employee_id: str
+    first_name: str
+    last_name: str
+    department_id: Optional[int] = None
+    employment_status: EmploymentStatus
+
+    @classmethod
+    def list_columns(cls) -> tuple[Any, ...]:
+        return tuple(getattr(HrdEmployee, name) for name in cls.model_fields)
+
+
 # Attendance schemas
 class AttendanceCheckIn(SQLModel, table=False):
-    location: Optional[str] = Field(default=None, max_length=255)
+    latitude: Optional[float] = Field(default=None, ge=-90, le=90)
+    longitude: Optional[float] = Field(default=None, ge=-180, le=180)
     notes: str = Field(default="", max_length=500)
 
+    @model_validator(mode="after")
+    def _validate_coordinates(self) -> Self:
+        _check_coordinates(self.latitude, self.longitude)
+        return self
+
 
 class AttendanceCheckOut(SQLModel, table=False):
-    location: Optional[str] = Field(default=None, max_length=255)
+    latitude: Optional[float] = Field(default=None, ge=-90, le=90)
+    longitude: Optional[float] = Field(default=None, ge=-180, le=180)
     notes: str = Field(default="", max_length=500)
 
+    @model_validator(mode="after")
+    def _validate_coordinates(self) -> Self:
+        _check_coordinates(self.latitude, self.longitude)
+        return self
+
 
 # Leave request schemas
 class LeaveRequestCreate(SQLModel, table=False):
@@ -446,7 +692,7 @@ class LeaveRequestCreate(SQLModel, table=False):
     start_date: date
     end_date: date
     reason: str = Field(max_length=1000)
-    supporting_documents: List[str] = Field(default=[])
+    supporting_documents: List[str] = Field(default_factory=list)
 
 
 class LeaveRequestApproval(SQLModel, table=False):
@@ -460,7 +706,7 @@ class DepartmentCreate(SQLModel, table=False):
     code: str = Field(max_length=20)
     description: str = Field(default="", max_length=500)
     manager_id: Optional[int] = Field(default=None)
-    budget: Optional[Decimal] = Field(default=None, decimal_places=2)
+    budget: Optional[Decimal] = Field(default=None, max_digits=12, decimal_places=2)
 
 
 class PositionCreate(SQLModel, table=False):
@@ -469,8 +715,8 @@ class PositionCreate(SQLModel, table=False):
     description: str = Field(default="", max_length=1000)
     department_id: int
     level: str = Field(max_length=50)
-    min_salary: Optional[Decimal] = Field(default=None, decimal_places=2)
-    max_salary: Optional[Decimal] = Field(default=None, decimal_places=2)
+    min_salary: Optional[Decimal] = Field(default=None, max_digits=12, decimal_places=2)
+    max_salary: Optional[Decimal] = Field(default=None, max_digits=12, decimal_places=2)
     requirements: str = Field(default="", max_length=2000)
 
 
@@ -481,7 +727,7 @@ class TrainingProgramCreate(SQLModel, table=False):
     trainer: str = Field(max_length=200)
     duration_hours: int
     max_participants: Optional[int] = Field(default=None)
-    cost_per_participant: Optional[Decimal] = Field(default=None, decimal_places=2)
+    cost_per_participant: Optional[Decimal] = Field(default=None, max_digits=12, decimal_places=2)
     start_date: datetime
     end_date: datetime
     location: str = Field(max_length=255)
@@ -493,17 +739,56 @@ class PerformanceReviewCreate(SQLModel, table=False):
     employee_id: int
     review_period_start: date
     review_period_end: date
-    overall_rating: Decimal = Field(decimal_places=2, ge=1, le=5)
-    goals_achievement: Decimal = Field(decimal_places=2, ge=0, le=100)
-    competency_scores: Dict[str, Any] = Field(default={})
+    overall_rating: Decimal = Field(max_digits=3, decimal_places=2, ge=1, le=5)
+    goals_achievement: Decimal = Field(max_digits=5, decimal_places=2, ge=0, le=100)
+    competency_scores: Dict[str, Any] = Field(default_factory=dict)
     strengths: str = Field(max_length=2000)
     areas_for_improvement: str = Field(max_length=2000)
     development_plan: str = Field(max_length=2000)
     reviewer_comments: str = Field(max_length=2000)
 
 
+class PerformanceReviewListItem(SQLModel, table=False):
+    """Review header for listings; the long free-text sections are only needed on the detail view."""
+
+    id: int
+    employee_id: int
+    reviewer_id: int
+    review_period_start: date
+    review_period_end: date
+    overall_rating: Decimal
+    goals_achievement: Decimal
+    is_final: bool
+
+    @classmethod
+    def list_columns(cls) -> tuple[Any, ...]:
+        return tuple(getattr(HrdPerformanceReview, name) for name in cls.model_fields)
+
+
+# Document schemas
+class DocumentListItem(SQLModel, table=False):
+    """Document metadata for listings; file_path is only resolved when a document is opened."""
+
+    id: int
+    employee_id: int
+    document_type: DocumentType
+    title: str
+    file_name: str
+    file_size: int
+    mime_type: str
+    is_confidential: bool
+    expiry_date: Optional[date] = None
+
+    @classmethod
+    def list_columns(cls) -> tuple[Any, ...]:
+        return tuple(getattr(HrdDocument, name) for name in cls.model_fields)
+
+
 # Dashboard statistics schemas
-class DashboardStats(SQLModel, table=False):
+# Output-only and computed from trusted aggregate queries, so these are plain slotted dataclasses
+# rather than validating SQLModel schemas. orjson serializes them natively.
+@dataclass(frozen=True, slots=True)
+class DashboardStats:
     total_employees: int
     active_employees: int
     present_today: int
@@ -513,7 +798,8 @@ class DashboardStats(SQLModel, table=False):
     recent_hires: int
 
 
-class EmployeeStats(SQLModel, table=False):
+@dataclass(frozen=True, slots=True)
+class EmployeeStats:
     my_attendance_this_month: int
     my_leave_balance: Dict[str, int]
     my_upcoming_trainings: int
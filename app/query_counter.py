@@ -0,0 +1,27 @@
+from contextlib import contextmanager
+from typing import Iterator, List, Union
+
+from sqlalchemy import Connection, Engine, event
+
+
+@contextmanager
+def count_queries(bind: Union[Connection, Engine]) -> Iterator[List[str]]:
+    """Collect every SQL statement executed on `bind` while the block runs.
+
+    Used in tests to pin the number of round-trips a code path may take, so lazy-loading regressions fail
+    loudly instead of silently turning into N+1 queries:
+
+        with count_queries(session.connection()) as queries:
+            load_employee_list(session)
+        assert len(queries) <= 3
+    """
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
@@ -1,11 +1,21 @@
-from app.database import create_tables
-from nicegui import ui
+from app.database import create_tables, ensure_attendance_partitions, get_session
+from app.lookup_cache import all_settings_cached, get_lookup_version
+from nicegui import run, ui
+
+
+async def maintain_attendance_partitions() -> None:
+    # partition DDL opens several connections and can wait on locks, so keep it off the event loop
+    await run.io_bound(ensure_attendance_partitions)
 
 
 def startup() -> None:
     # this function is called before the first request
     create_tables()
 
+    # settings are read on nearly every request, so load them once up front
+    with get_session() as session:
+        all_settings_cached(get_lookup_version(session))
+
     @ui.page("/")
     def index():
         ui.label("🚧 Work in progress 🚧").style("font-size: 2rem; text-align: center; margin-top: 2rem")
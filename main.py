@@ -1,6 +1,6 @@
 import logging
 import os
-from app.startup import startup
+from app.startup import maintain_attendance_partitions, startup
 from nicegui import app, ui
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -31,6 +31,10 @@ logging.getLogger("sqlalchemy.engine.Engine").setLevel(logging.WARNING)
 
 app.on_startup(startup)
 
+# startup() already made this month's partitions; keep upcoming months ahead of long-running workers.
+# Registered here, not in startup(), so the timer exists once even where startup() runs repeatedly (tests).
+app.timer(24 * 60 * 60, maintain_attendance_partitions, immediate=False)
+
 # Add security headers middleware
 app.add_middleware(SecurityHeadersMiddleware)
 
@@ -0,0 +1,150 @@
+from datetime import date, time
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session, col, select
+
+from app.bulk_writes import bulk_insert_audit_logs, bulk_upsert_attendance
+from app.database import create_tables, get_session
+from app.models import AttendanceStatus, HrdAttendance, HrdAuditLog, HrdAuditLogPayload, HrdUser
+
+
+def _create_user(session: Session) -> int:
+    user = HrdUser(email=f"{uuid4().hex}@example.com", password_hash="x")
+    session.add(user)
+    session.commit()
+    assert user.id is not None
+    return user.id
+
+
+@pytest.mark.sqlmodel
+def test_bulk_upsert_attendance_updates_existing_day():
+    create_tables()
+    today = date.today()
+
+    with get_session() as session:
+        user_id = _create_user(session)
+        bulk_upsert_attendance(session, [{"user_id": user_id, "date": today, "check_in_time": time(9, 0)}])
+        session.commit()
+
+        bulk_upsert_attendance(
+            session,
+            [
+                {
+                    "user_id": user_id,
+                    "date": today,
+                    "check_in_time": time(9, 0),
+                    "check_out_time": time(17, 30),
+                    "status": AttendanceStatus.PRESENT,
+                    "total_hours": Decimal("8.50"),
+                }
+            ],
+        )
+        session.commit()
+
+        records = session.exec(select(HrdAttendance).where(HrdAttendance.user_id == user_id)).all()
+
+    assert len(records) == 1
+    record = records[0]
+    assert record.check_in_time == time(9, 0)
+    assert record.check_out_time == time(17, 30)
+    assert record.status == AttendanceStatus.PRESENT
+    assert record.total_hours == Decimal("8.50")
+    assert record.overtime_hours == Decimal("0")
+    assert record.notes == ""
+
+
+@pytest.mark.sqlmodel
+def test_bulk_insert_audit_logs_pairs_payloads_with_ids():
+    create_tables()
+
+    with get_session() as session:
+        user_id = _create_user(session)
+        entries = [
+            {
+                "user_id": user_id,
+                "action": "UPDATE",
+                "table_name": "hrd_employees",
+                "record_id": record_id,
+                "ip_address": "10.0.0.1",
+                "new_values": {"record_id": record_id},
+            }
+            for record_id in range(5)
+        ]
+        ids = bulk_insert_audit_logs(session, entries)
+        session.commit()
+
+        payloads = session.exec(select(HrdAuditLogPayload).where(col(HrdAuditLogPayload.id).in_(ids))).all()
+
+    assert len(ids) == len(set(ids)) == 5
+    by_id = {payload.id: payload for payload in payloads}
+    for record_id, audit_id in enumerate(ids):
+        assert by_id[audit_id].new_values == {"record_id": record_id}
+        assert by_id[audit_id].old_values == {}
+        assert by_id[audit_id].user_agent == ""
+
+
+@pytest.mark.sqlmodel
+def test_bulk_upsert_attendance_keeps_values_in_mixed_key_batches():
+    create_tables()
+    today = date.today()
+
+    with get_session() as session:
+        first_id, second_id, third_id = (_create_user(session) for _ in range(3))
+        bulk_upsert_attendance(
+            session,
+            [
+                {"user_id": first_id, "date": today, "check_in_time": time(8, 0)},
+                {"user_id": second_id, "date": today, "check_in_time": time(9, 0), "check_out_time": time(17, 0)},
+                {"user_id": third_id, "date": today, "check_in_time": time(10, 0), "total_hours": Decimal("7.00")},
+                {"user_id": first_id, "date": today, "check_in_time": time(8, 0), "check_out_time": time(16, 0)},
+            ],
+        )
+        session.commit()
+
+        records = session.exec(
+            select(HrdAttendance).where(col(HrdAttendance.user_id).in_([first_id, second_id, third_id]))
+        ).all()
+
+    by_user = {record.user_id: record for record in records}
+    assert len(records) == 3
+    assert by_user[first_id].check_out_time == time(16, 0)
+    assert by_user[second_id].check_out_time == time(17, 0)
+    assert by_user[second_id].total_hours is None
+    assert by_user[third_id].check_out_time is None
+    assert by_user[third_id].total_hours == Decimal("7.00")
+    assert by_user[third_id].status == AttendanceStatus.ABSENT
+
+
+@pytest.mark.sqlmodel
+def test_bulk_insert_audit_logs_keeps_values_in_mixed_key_batches():
+    create_tables()
+
+    with get_session() as session:
+        user_id = _create_user(session)
+        ids = bulk_insert_audit_logs(
+            session,
+            [
+                {"user_id": user_id, "action": "LOGIN", "table_name": "hrd_users", "ip_address": "testclient"},
+                {
+                    "user_id": user_id,
+                    "action": "UPDATE",
+                    "table_name": "hrd_employees",
+                    "record_id": 42,
+                    "ip_address": "10.0.0.2",
+                    "user_agent": "pytest",
+                },
+            ],
+        )
+        session.commit()
+
+        logs = session.exec(select(HrdAuditLog).where(col(HrdAuditLog.id).in_(ids))).all()
+        payloads = session.exec(select(HrdAuditLogPayload).where(col(HrdAuditLogPayload.id).in_(ids))).all()
+
+    record_ids = {log.id: log.record_id for log in logs}
+    ip_addresses = {log.id: log.ip_address for log in logs}
+    user_agents = {payload.id: payload.user_agent for payload in payloads}
+    assert record_ids == {ids[0]: None, ids[1]: 42}
+    assert ip_addresses == {ids[0]: None, ids[1]: "10.0.0.2"}
+    assert user_agents == {ids[0]: "", ids[1]: "pytest"}
@@ -0,0 +1,67 @@
+import logging
+from datetime import date
+
+import pytest
+from sqlmodel import text
+
+from app.database import ENGINE, _add_months, create_tables, ensure_attendance_partitions
+
+
+def _attendance_partitions() -> set[str]:
+    with ENGINE.connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'hrd_attendance'::regclass"
+            )
+        )
+        return {row[0] for row in rows}
+
+
+@pytest.mark.parametrize(
+    ("month_start", "months", "expected"),
+    [
+        (date(2024, 5, 1), 0, date(2024, 5, 1)),
+        (date(2024, 11, 1), 1, date(2024, 12, 1)),
+        (date(2024, 12, 1), 1, date(2025, 1, 1)),
+        (date(2024, 11, 1), 3, date(2025, 2, 1)),
+        (date(2024, 1, 1), -1, date(2023, 12, 1)),
+        (date(2024, 3, 1), 25, date(2026, 4, 1)),
+    ],
+)
+def test_add_months_wraps_years(month_start: date, months: int, expected: date):
+    assert _add_months(month_start, months) == expected
+
+
+@pytest.mark.sqlmodel
+def test_ensure_attendance_partitions_is_idempotent():
+    create_tables()
+    this_month = date.today().replace(day=1)
+    expected = {
+        f"hrd_attendance_y{month.year}m{month.month:02d}"
+        for month in (_add_months(this_month, offset) for offset in range(-1, 3))
+    } | {"hrd_attendance_default"}
+
+    ensure_attendance_partitions()
+    first = _attendance_partitions()
+    ensure_attendance_partitions()
+
+    assert expected <= first
+    assert _attendance_partitions() == first
+
+
+@pytest.mark.sqlmodel
+def test_ensure_attendance_partitions_skips_unpartitioned_table(caplog: pytest.LogCaptureFixture):
+    create_tables()
+    with ENGINE.begin() as conn:
+        conn.execute(text("ALTER TABLE hrd_attendance RENAME TO hrd_attendance_partitioned"))
+        conn.execute(text("CREATE TABLE hrd_attendance (id integer)"))
+    try:
+        caplog.set_level(logging.WARNING, logger="app.database")
+        ensure_attendance_partitions()
+        assert _attendance_partitions() == set()
+        assert "manual migration required" in caplog.text
+    finally:
+        with ENGINE.begin() as conn:
+            conn.execute(text("DROP TABLE hrd_attendance"))
+            conn.execute(text("ALTER TABLE hrd_attendance_partitioned RENAME TO hrd_attendance"))
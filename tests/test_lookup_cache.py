@@ -0,0 +1,61 @@
+from uuid import uuid4
+
+import pytest
+from sqlmodel import col, delete
+
+from app.database import create_tables, get_session
+from app.lookup_cache import (
+    LOOKUP_VERSION_KEY,
+    all_departments_cached,
+    bump_lookup_version,
+    get_lookup_version,
+)
+from app.models import HrdDepartment, HrdSetting, HrdUser
+
+
+@pytest.mark.sqlmodel
+def test_bump_lookup_version_inserts_then_increments():
+    create_tables()
+
+    with get_session() as session:
+        session.exec(delete(HrdSetting).where(col(HrdSetting.key) == LOOKUP_VERSION_KEY))
+        user = HrdUser(email=f"{uuid4().hex}@example.com", password_hash="x")
+        session.add(user)
+        session.commit()
+        assert user.id is not None
+        assert get_lookup_version(session) == 0
+
+        bump_lookup_version(session, user.id)
+        session.commit()
+        assert get_lookup_version(session) == 1
+
+        bump_lookup_version(session, user.id)
+        bump_lookup_version(session, user.id)
+        session.commit()
+        assert get_lookup_version(session) == 3
+
+
+@pytest.mark.sqlmodel
+def test_bump_lookup_version_reloads_cached_departments():
+    create_tables()
+
+    with get_session() as session:
+        user = HrdUser(email=f"{uuid4().hex}@example.com", password_hash="x")
+        session.add(user)
+        session.commit()
+        assert user.id is not None
+
+        before = all_departments_cached(get_lookup_version(session))
+        assert all_departments_cached(get_lookup_version(session)) is before
+
+        code = uuid4().hex[:20]
+        session.add(HrdDepartment(name="Cache test", code=code))
+        session.commit()
+        assert code not in {department.code for department in all_departments_cached(get_lookup_version(session))}
+
+        bump_lookup_version(session, user.id)
+        session.commit()
+        after = all_departments_cached(get_lookup_version(session))
+
+    assert code in {department.code for department in after}
+    assert len(after) == len(before) + 1
@@ -0,0 +1,37 @@
+import pytest
+from pydantic import ValidationError
+
+from app.models import HrdAuditLog, HrdUser, UserCreate, normalize_ip_address
+
+
+def test_email_accepts_valid_address():
+    assert UserCreate(email="jane.doe+hr@example.co.id", password="secret1").email == "jane.doe+hr@example.co.id"
+    assert HrdUser.model_validate({"email": "jane@example.com", "password_hash": "x"}).email == "jane@example.com"
+
+
+@pytest.mark.parametrize("email", ["not-an-email", "jane@example", "a@b.com\n", " a@b.com"])
+def test_email_rejects_invalid_address(email: str):
+    with pytest.raises(ValidationError):
+        UserCreate(email=email, password="secret1")
+    with pytest.raises(ValidationError):
+        HrdUser.model_validate({"email": email, "password_hash": "x"})
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("10.0.0.1", "10.0.0.1"),
+        (" 192.168.1.20 ", "192.168.1.20"),
+        ("2001:DB8::0:1", "2001:db8::1"),
+        ("", None),
+        ("unknown", None),
+        ("testclient", None),
+        (None, None),
+    ],
+)
+def test_normalize_ip_address(value: str | None, expected: str | None):
+    assert normalize_ip_address(value) == expected
+    audit_log = HrdAuditLog.model_validate(
+        {"user_id": 1, "action": "LOGIN", "table_name": "hrd_users", "ip_address": value}
+    )
+    assert audit_log.ip_address == expected
@@ -0,0 +1,119 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import Session, col, select
+
+from app.database import create_tables, get_session
+from app.models import EMPLOYEE_LIST_OPTIONS, EmployeeListItem, HrdEmployee, HrdUser, construct_from_row
+from app.query_counter import count_queries
+
+
+def _create_employee(session: Session, manager_id: int | None) -> int:
+    user = HrdUser(email=f"{uuid4().hex}@example.com", password_hash="x")
+    session.add(user)
+    session.flush()
+    assert user.id is not None
+    employee = HrdEmployee(
+        employee_id=uuid4().hex[:20],
+        user_id=user.id,
+        first_name="Test",
+        last_name="Employee",
+        date_of_birth=date(1990, 1, 1),
+        phone="000",
+        address="Test street 1",
+        emergency_contact_name="Contact",
+        emergency_contact_phone="111",
+        hire_date=date(2020, 1, 1),
+        manager_id=manager_id,
+    )
+    session.add(employee)
+    session.flush()
+    assert employee.id is not None
+    return employee.id
+
+
+def _seed_team(session: Session) -> tuple[int, list[int]]:
+    manager_id = _create_employee(session, None)
+    report_ids = [_create_employee(session, manager_id) for _ in range(3)]
+    session.commit()
+    return manager_id, report_ids
+
+
+@pytest.mark.sqlmodel
+def test_employee_list_projection_is_single_query():
+    create_tables()
+    with get_session() as session:
+        _seed_team(session)
+
+    with get_session() as session, count_queries(session.connection()) as queries:
+        rows = session.exec(select(*EmployeeListItem.list_columns())).all()
+        items = [construct_from_row(EmployeeListItem, row) for row in rows]
+
+    assert len(items) == len(rows) >= 4
+    assert len(queries) == 1
+
+
+@pytest.mark.sqlmodel
+def test_employees_with_manager_and_reports_load_in_two_queries():
+    create_tables()
+    with get_session() as session:
+        manager_id, report_ids = _seed_team(session)
+    team_ids = [manager_id, *report_ids]
+
+    with get_session() as session, count_queries(session.connection()) as queries:
+        employees = session.exec(select(HrdEmployee).where(col(HrdEmployee.id).in_(team_ids))).all()
+        managers = {employee.id: employee.manager.id if employee.manager else None for employee in employees}
+        reports = {employee.id: sorted(sub.id for sub in employee.subordinates) for employee in employees}
+
+    assert len(queries) == 2
+    assert managers[manager_id] is None
+    assert all(managers[report_id] == manager_id for report_id in report_ids)
+    assert reports[manager_id] == sorted(report_ids)
+
+
+@pytest.mark.sqlmodel
+def test_employee_list_options_load_manager_in_one_query():
+    create_tables()
+    with get_session() as session:
+        manager_id, report_ids = _seed_team(session)
+
+    with get_session() as session, count_queries(session.connection()) as queries:
+        statement = select(HrdEmployee).where(col(HrdEmployee.id).in_(report_ids)).options(*EMPLOYEE_LIST_OPTIONS)
+        employees = session.exec(statement).all()
+        managers = {employee.manager.id for employee in employees if employee.manager}
+        report, manager = employees[0], employees[0].manager
+        assert manager is not None
+        for load in (lambda: report.user, lambda: report.subordinates, lambda: manager.user):
+            with pytest.raises(InvalidRequestError):
+                load()
+
+    assert len(queries) == 1
+    assert len(employees) == len(report_ids)
+    assert managers == {manager_id}
+
+
+@pytest.mark.sqlmodel
+def test_raise_loaded_collection_cannot_be_lazy_loaded():
+    create_tables()
+    with get_session() as session:
+        manager_id, _ = _seed_team(session)
+
+    with get_session() as session:
+        manager = session.get(HrdEmployee, manager_id)
+        assert manager is not None
+        with pytest.raises(InvalidRequestError):
+            _ = manager.leave_requests
+
+
+@pytest.mark.sqlmodel
+def test_count_queries_stops_recording_on_exit():
+    create_tables()
+    with get_session() as session:
+        connection = session.connection()
+        with count_queries(connection) as queries:
+            session.exec(select(HrdUser.id).limit(1)).all()
+        session.exec(select(HrdUser.id).limit(1)).all()
+
+    assert len(queries) == 1